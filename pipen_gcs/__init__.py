@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import time
 import warnings
 
 from typing import TYPE_CHECKING
 from pathlib import Path
+from tempfile import gettempdir
 
 from pipen import plugin
 from pipen.defaults import ProcOutputType
 from pipen.utils import get_logger
-from google.cloud import storage
 
 from .utils import (
+    _bucket,
+    enlarge_connection_pool,
     parse_gcs_uri,
     get_gs_type,
     update_plugin_data,
@@ -27,6 +31,9 @@ from .utils import (
     upload_gs_dir,
     create_gs_dir,
     InvalidGoogleStorageURIError,
+    SLICED_CHUNK_SIZE,
+    SLICED_MAX_WORKERS,
+    COPY_BUFFER_SIZE,
 )
 
 if TYPE_CHECKING:
@@ -36,6 +43,20 @@ __version__ = "0.0.3"
 logger = get_logger("gcs")
 
 
+def _default_localize_root() -> str:
+    """Pick a root for auto-localized files, preferring tmpfs
+
+    Localized files are written once and read once by the job script, so
+    a memory-backed filesystem keeps the disk out of the hot path.
+    """
+    root = os.environ.get("PIPEN_GCS_CACHE_ROOT")
+    if root:
+        return root
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return gettempdir()
+
+
 class PipenGcsPlugin:
     """A plugin for pipen to handle file metadata in Google Cloud Storage
 
@@ -43,9 +64,26 @@ class PipenGcsPlugin:
         gcs_localize: False or a directory to download files to and upload back
             the output files. If False, the plugin will not download or upload
             files. The job script should handle the files in the cloud.
+            If True, a directory is auto-selected: $PIPEN_GCS_CACHE_ROOT if
+            set, otherwise /dev/shm (tmpfs) when available, falling back to
+            the system temporary directory.
         gcs_credentials: The path to the Google Cloud Storage credentials file.
         gcs_localize_force: Whether to force localize the files even if they
             are already in the local directory.
+        gcs_concurrency: The number of concurrent transfers when localizing
+            directories.
+        gcs_upload_chunk_size: The chunk size for sliced uploads of large
+            output files.
+        gcs_upload_workers: The number of workers for sliced uploads of
+            large output files.
+        gcs_download_chunk_size: The chunk size for sliced downloads of
+            large input files.
+        gcs_download_workers: The number of workers for sliced downloads of
+            large input files.
+        gcs_meta_ttl: How long (in seconds) to reuse the cached prefix
+            listings behind output existence checks. Path-type lookups
+            are cached (and invalidated on writes) at the utils layer.
+        gcs_copy_buffer: The buffer size for single-stream transfers.
     """
 
     version = __version__
@@ -53,6 +91,19 @@ class PipenGcsPlugin:
 
     def __init__(self):
         self.gclient = None  # pragma: no cover
+        self._transfer_sem = None  # pragma: no cover
+        # Blob names under a gs://bucket/prefix/, so existence checks for
+        # sibling outputs share one LIST request
+        self._prefix_cache: dict[str, tuple[float, set[str]]] = {}
+        # (uri, localpath) pairs already localized in this run, so inputs
+        # shared across jobs are only transferred once
+        self._localized: set[tuple[str, str]] = set()
+        # Resolved gcs_localize roots, keyed by the raw option value
+        # (procs can override the option, so there may be more than one)
+        self._localize_roots: dict[str, Path] = {}
+        # Local directories already created; dirs are never removed
+        # mid-run, so repeated mkdirs for shared parents are skipped
+        self._mkdir_seen: set[str] = set()
 
     @plugin.impl
     async def on_init(self, pipen: Pipen) -> None:
@@ -64,23 +115,101 @@ class PipenGcsPlugin:
         # Whether to force localize the files even if they are already in the local
         # directory
         pipen.config.plugin_opts.setdefault("gcs_localize_force", False)
+        # The number of concurrent transfers when localizing directories
+        pipen.config.plugin_opts.setdefault("gcs_concurrency", 16)
+        # The chunk size and number of workers for sliced uploads of
+        # large output files
+        pipen.config.plugin_opts.setdefault("gcs_upload_chunk_size", SLICED_CHUNK_SIZE)
+        pipen.config.plugin_opts.setdefault("gcs_upload_workers", SLICED_MAX_WORKERS)
+        # The chunk size and number of workers for sliced downloads of
+        # large input files
+        pipen.config.plugin_opts.setdefault(
+            "gcs_download_chunk_size", SLICED_CHUNK_SIZE
+        )
+        pipen.config.plugin_opts.setdefault("gcs_download_workers", SLICED_MAX_WORKERS)
+        # How long (in seconds) to reuse cached metadata lookups
+        pipen.config.plugin_opts.setdefault("gcs_meta_ttl", 5.0)
+        # The buffer size for single-stream transfers
+        pipen.config.plugin_opts.setdefault("gcs_copy_buffer", COPY_BUFFER_SIZE)
 
     @plugin.impl
     async def on_start(self, pipen: Pipen) -> None:
         """Login to Google Cloud Storage using the credentials if provided"""
+        # deferred so that pipen processes not using this plugin's hooks
+        # don't pay the google.cloud.storage import at startup
+        from google.cloud import storage
+
         logger.setLevel("INFO")
+        # the plugin instance is a process-wide singleton; drop state
+        # carried over from a previous Pipen run in the same process so
+        # stale caches can't mask remote changes (the utils-level
+        # get_gs_type cache is keyed on the client, which is recreated
+        # below, so it starts fresh on its own)
+        self._prefix_cache.clear()
+        self._localized.clear()
+        self._mkdir_seen.clear()
+
         plugin_opts = pipen.config.plugin_opts or {}
         if plugin_opts.get("gcs_credentials"):
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = plugin_opts[
                 "gcs_credentials"
             ]
 
+        # Bound the number of concurrent transfers across all jobs so
+        # parallel uploads don't swamp the event loop
+        self._transfer_sem = asyncio.Semaphore(
+            plugin_opts.get("gcs_concurrency", 16)
+        )
+
         with warnings.catch_warnings(record=True) as warns:
             warnings.simplefilter("always", UserWarning)
             self.gclient = storage.Client()
             for warn in warns:  # pragma: no cover
                 logger.warning(str(warn.message))
 
+        # Enlarge the session's connection pool so the concurrent transfers
+        # reuse pooled TLS connections instead of handshaking per request
+        enlarge_connection_pool(self.gclient)
+
+    def _localize_root(self, gcs_localize) -> Path:
+        """Resolve the gcs_localize option into a Path, reusing resolutions"""
+        key = str(gcs_localize)
+        root = self._localize_roots.get(key)
+        if root is None:
+            if gcs_localize is True:
+                root = Path(_default_localize_root()) / "pipen-gcs"
+            else:
+                root = Path(gcs_localize)
+            self._localize_roots[key] = root
+        return root
+
+    def _prefix_names(self, prefix_uri: str, ttl: float) -> set[str]:
+        """List the blob names under a prefix once and reuse them"""
+        stamp, names = self._prefix_cache.get(prefix_uri, (0.0, None))
+        if names is not None and time.monotonic() - stamp < ttl:
+            return names
+
+        bucket, prefix = parse_gcs_uri(prefix_uri)
+        names = {
+            blob.name
+            for blob in _bucket(self.gclient, bucket).list_blobs(
+                prefix=prefix, fields="items(name),nextPageToken"
+            )
+        }
+        self._prefix_cache[prefix_uri] = (time.monotonic(), names)
+        return names
+
+    def _invalidate_meta(self, path: str) -> None:
+        """Drop cached prefix listings for a path after it was modified
+
+        The get_gs_type cache lives in utils and is invalidated by the
+        write helpers themselves.
+        """
+        path = path.rstrip("/")
+        for prefix in list(self._prefix_cache):
+            if path.startswith(prefix.rstrip("/")):
+                del self._prefix_cache[prefix]
+
     @plugin.impl
     def norm_inpath(self, job, inpath, is_dir):
         if not isinstance(inpath, str) or not inpath.startswith(
@@ -92,6 +221,7 @@ class PipenGcsPlugin:
         plugin_opts = job.proc.plugin_opts or {}
         gcs_localize = plugin_opts.get("gcs_localize", False)
         gcs_localize_force = plugin_opts.get("gcs_localize_force", False)
+        gcs_concurrency = plugin_opts.get("gcs_concurrency", 16)
 
         gstype = get_gs_type(self.gclient, inpath)
         if gstype == "none":
@@ -107,16 +237,49 @@ class PipenGcsPlugin:
         if not gcs_localize:
             return inpath
 
-        gcs_localize = Path(gcs_localize)
+        gcs_localize = self._localize_root(gcs_localize)
         # Download the file to local
         bucket, path = parse_gcs_uri(inpath)
         localpath = gcs_localize.joinpath(bucket, path)
+        seen_key = (inpath, str(localpath))
+        if seen_key in self._localized and not gcs_localize_force:
+            # the same URI has already been localized in this run
+            # (e.g. a reference file fanned across jobs); force always
+            # goes through the download
+            return localpath
+
         job.log("info", f"Localizing {inpath} ...", logger=logger)
         if is_dir:
-            download_gs_dir(self.gclient, inpath, localpath, gcs_localize_force)
+            download_gs_dir(
+                self.gclient,
+                inpath,
+                localpath,
+                gcs_localize_force,
+                max_workers=gcs_concurrency,
+                chunk_size=plugin_opts.get(
+                    "gcs_download_chunk_size", SLICED_CHUNK_SIZE
+                ),
+                sliced_workers=plugin_opts.get(
+                    "gcs_download_workers", SLICED_MAX_WORKERS
+                ),
+                copy_buffer=plugin_opts.get("gcs_copy_buffer", COPY_BUFFER_SIZE),
+            )
         else:
-            download_gs_file(self.gclient, inpath, localpath, gcs_localize_force)
+            download_gs_file(
+                self.gclient,
+                inpath,
+                localpath,
+                gcs_localize_force,
+                chunk_size=plugin_opts.get(
+                    "gcs_download_chunk_size", SLICED_CHUNK_SIZE
+                ),
+                max_workers=plugin_opts.get(
+                    "gcs_download_workers", SLICED_MAX_WORKERS
+                ),
+                copy_buffer=plugin_opts.get("gcs_copy_buffer", COPY_BUFFER_SIZE),
+            )
 
+        self._localized.add(seen_key)
         return localpath
 
     @plugin.impl
@@ -140,15 +303,18 @@ class PipenGcsPlugin:
         if not gcs_localize:
             return outpath
 
-        gcs_localize = Path(gcs_localize)
+        gcs_localize = self._localize_root(gcs_localize)
         bucket, path = parse_gcs_uri(outpath)
         localpath = gcs_localize.joinpath(bucket, path)
         if is_dir:
             outpath = outpath.rstrip("/") + "/"
             create_gs_dir(self.gclient, outpath)
-            localpath.mkdir(parents=True, exist_ok=True)
-        else:
+            if str(localpath) not in self._mkdir_seen:
+                localpath.mkdir(parents=True, exist_ok=True)
+                self._mkdir_seen.add(str(localpath))
+        elif str(localpath.parent) not in self._mkdir_seen:
             localpath.parent.mkdir(parents=True, exist_ok=True)
+            self._mkdir_seen.add(str(localpath.parent))
 
         # save the original output with gs://
         ret = str(localpath)
@@ -172,10 +338,11 @@ class PipenGcsPlugin:
         ):  # pragma: no cover
             return None
 
+        self._invalidate_meta(path)
         if is_dir:
-            return clear_gs_dir(self.gclient, path)
+            return await asyncio.to_thread(clear_gs_dir, self.gclient, path)
 
-        return clear_gs_file(self.gclient, path)
+        return await asyncio.to_thread(clear_gs_file, self.gclient, path)
 
     @plugin.impl
     async def output_exists(self, job, path, is_dir):
@@ -184,20 +351,59 @@ class PipenGcsPlugin:
         ):  # pragma: no cover
             return None
 
-        if is_dir:
-            return gs_dir_exists(self.gclient, path)
+        plugin_opts = job.proc.plugin_opts or {}
+        ttl = plugin_opts.get("gcs_meta_ttl", 5.0)
+        bucket, blobpath = parse_gcs_uri(path.rstrip("/"))
+        # list the parent prefix (or the path itself for top-level outputs)
+        # so sibling outputs share one LIST request
+        prefix = blobpath.rsplit("/", 1)[0] + "/" if "/" in blobpath else blobpath
+        names = await asyncio.to_thread(
+            self._prefix_names, f"gs://{bucket}/{prefix}", ttl
+        )
 
-        return gs_file_exists(self.gclient, path)
+        if is_dir:
+            dirkey = blobpath + "/"
+            return any(name.startswith(dirkey) for name in names)
 
-    @plugin.impl
-    async def on_job_succeeded(self, job):
-        for key, value in job.output.items():
-            gspath = get_plugin_data(job, value)
-            if gspath is None:
-                continue
+        return blobpath in names
 
+    async def _upload_one(self, job, key, value, gspath):
+        """Upload a single output file/dir back to the cloud"""
+        plugin_opts = job.proc.plugin_opts or {}
+        async with self._transfer_sem:
             job.log("info", f"Uploading output '{key}' to {gspath} ...", logger=logger)
             if job._output_types[key] == ProcOutputType.FILE:
-                upload_gs_file(self.gclient, value, gspath)
+                await asyncio.to_thread(
+                    upload_gs_file,
+                    self.gclient,
+                    value,
+                    gspath,
+                    chunk_size=plugin_opts.get(
+                        "gcs_upload_chunk_size", SLICED_CHUNK_SIZE
+                    ),
+                    max_workers=plugin_opts.get(
+                        "gcs_upload_workers", SLICED_MAX_WORKERS
+                    ),
+                    copy_buffer=plugin_opts.get("gcs_copy_buffer", COPY_BUFFER_SIZE),
+                )
             else:
-                upload_gs_dir(self.gclient, value, gspath)
+                await asyncio.to_thread(
+                    upload_gs_dir,
+                    self.gclient,
+                    value,
+                    gspath,
+                    max_workers=plugin_opts.get("gcs_concurrency", 16),
+                )
+            self._invalidate_meta(gspath)
+
+    @plugin.impl
+    async def on_job_succeeded(self, job):
+        coros = [
+            self._upload_one(job, key, value, gspath)
+            for key, value in job.output.items()
+            if (gspath := get_plugin_data(job, value)) is not None
+        ]
+        if coros:
+            # overlap the transfers so wall time is the max, not the sum,
+            # across outputs
+            await asyncio.gather(*coros)
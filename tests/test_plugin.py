@@ -1,13 +1,27 @@
 import os
 import sys
+from tempfile import gettempdir
+
 import pytest
 
 from pipen import Proc, Pipen
-from pipen_gcs import InvalidGoogleStorageURIError
+from pipen_gcs import InvalidGoogleStorageURIError, _default_localize_root
 from pipen_gcs.utils import gs_file_exists
 from .conftest import BUCKET
 
 
+def test_default_localize_root(monkeypatch):
+    monkeypatch.setenv("PIPEN_GCS_CACHE_ROOT", "/cache/root")
+    assert _default_localize_root() == "/cache/root"
+
+    monkeypatch.delenv("PIPEN_GCS_CACHE_ROOT")
+    root = _default_localize_root()
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        assert root == "/dev/shm"
+    else:  # pragma: no cover
+        assert root == gettempdir()
+
+
 @pytest.mark.forked
 def test_pipeline_localize(bucket, tmp_path, caplog):
     infile = f"gs://{BUCKET}/test.txt"
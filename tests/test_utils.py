@@ -4,6 +4,9 @@ from datetime import datetime
 import pytest
 from pipen_gcs.utils import (
     _mtime,
+    _invalidate_gs_type,
+    _GS_TYPE_CACHE,
+    GcsPath,
     parse_gcs_uri,
     get_gs_type,
     update_plugin_data,
@@ -36,12 +39,48 @@ def test_mtime(bucket):
         ("gs://bucket/path/to/file", "bucket", "path/to/file"),
         ("gs://bucket/path/to/dir/", "bucket", "path/to/dir/"),
         ("gs://bucket/", "bucket", ""),
+        ("gs://bucket", "bucket", ""),
+        # schemeless form takes the str.partition fallback
+        ("bucket/path/to/file", "bucket", "path/to/file"),
+        # '?'/'#' in object names must not be read as query/fragment
+        ("gs://bucket/path/with?mark", "bucket", "path/with?mark"),
+        ("gs://bucket/path/with#hash", "bucket", "path/with#hash"),
     ],
 )
 def test_parse_gs_uri(uri, bckt, path):
     assert parse_gcs_uri(uri) == (bckt, path)
 
 
+def test_gcs_path():
+    gp = GcsPath.parse("gs://bucket/path/to/file")
+    # parses are cached, so the same URI yields the same object
+    assert gp is GcsPath.parse("gs://bucket/path/to/file")
+    assert (gp.bucket, gp.path) == ("bucket", "path/to/file")
+    assert gp.dir_path == "path/to/file/"
+    assert GcsPath.parse("gs://bucket/path/to/dir/").dir_path == "path/to/dir/"
+
+
+def test_get_gs_type_cached():
+    # bare-bucket URIs are classified without any RPC, so a dummy
+    # client exercises the cache layer on its own
+    class FakeClient:
+        ...
+
+    client = FakeClient()
+    uri = "gs://some-bucket/"
+    assert get_gs_type(client, uri) == "bucket"
+
+    # poison the cached answer to prove it is consulted within the TTL
+    stamp, _ = _GS_TYPE_CACHE[client][uri]
+    _GS_TYPE_CACHE[client][uri] = (stamp, "dir")
+    assert get_gs_type(client, uri) == "dir"
+
+    # writes evict covering entries and the next call re-classifies
+    _invalidate_gs_type(client, uri)
+    assert uri not in _GS_TYPE_CACHE[client]
+    assert get_gs_type(client, uri) == "bucket"
+
+
 @pytest.mark.parametrize(
     "uri, out",
     [
@@ -64,9 +103,14 @@ def test_update_get_plugin_data():
             self.proc = proc
 
     job = J(P())
+    # defaults before anything has been stored on the class
+    assert get_plugin_data(job, "localpath") is None
+    assert get_plugin_data(job, "localpath", "default") == "default"
+
     update_plugin_data(job, "localpath", "gs://bucket/path")
     assert get_plugin_data(job, "localpath") == "gs://bucket/path"
     assert P.__meta__["plugin_data"]["gcs"]["localpath"] == "gs://bucket/path"
+    assert get_plugin_data(job, "otherpath", "default") == "default"
 
 
 def test_download_gs_file(bucket, tmp_path):